@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import os
 import sqlite3
-import uuid
-from dataclasses import dataclass
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, Query
+import orjson
+from fastapi import Body, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 # =========================================
@@ -19,11 +23,28 @@ PRIORITIES = ["P0", "P1", "P2", "P3"]
 STATUSES = ["open", "investigating", "mitigated", "resolved"]
 ROLES = ["On-call", "Ops Lead", "Support", "Engineering"]
 
+# O(1) membership checks + prebuilt "allowed" text for the normalizers
+_PRIORITIES_SET = frozenset(PRIORITIES)
+_STATUSES_SET = frozenset(STATUSES)
+_ROLES_SET = frozenset(ROLES)
+_PRIORITIES_MSG = str(PRIORITIES)
+_STATUSES_MSG = str(STATUSES)
+_ROLES_MSG = str(ROLES)
+
 SLA_MINUTES = {"P0": 30, "P1": 120, "P2": 480, "P3": 1440}
 
 BREACH_THRESHOLD_TOTAL = 5
 AGING_THRESHOLD_24H = 5
 
+# /ops/health is polled by the dashboard and reused by the recommendation
+# endpoints; incidents change on human timescales, so a short TTL is enough.
+HEALTH_CACHE_TTL_SECONDS = 2.0
+
+# Webhooks retry identical payloads; memoize triage on (title, description).
+TRIAGE_CACHE_SIZE = 4096
+# Upper bound on items per /triage:batch request.
+TRIAGE_BATCH_MAX_ITEMS = 1000
+
 STATUS_TRANSITIONS = {
     "open": ["investigating"],
     "investigating": ["mitigated", "resolved"],
@@ -33,6 +54,10 @@ STATUS_TRANSITIONS = {
 
 SEED_IF_EMPTY = True
 
+# Bump when init_db() gains new tables/columns/indexes; startup skips the
+# migration block when the stored version matches.
+SCHEMA_VERSION = "1"
+
 # =========================================
 # Helpers (timezone-safe)
 # =========================================
@@ -44,148 +69,187 @@ def dt_to_iso(dt: Optional[datetime]) -> Optional[str]:
     return dt.isoformat() if dt else None
 
 
-def iso_to_dt(s: Optional[str]) -> Optional[datetime]:
+def _new_id() -> str:
     """
-    Parse ISO strings that may be naive ("2026-...") or aware ("...+00:00"/"Z"),
-    and normalize to timezone-aware UTC.
+    ULID layout (48-bit ms timestamp + 80 random bits) as 32 hex chars.
+    Time-ordered, so new rows land at the end of the primary-key B-tree.
     """
-    if not s:
-        return None
-    try:
-        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
-    except Exception:
-        return None
-
-
-def minutes_between(a: datetime, b: datetime) -> int:
-    if a.tzinfo is None:
-        a = a.replace(tzinfo=timezone.utc)
-    if b.tzinfo is None:
-        b = b.replace(tzinfo=timezone.utc)
-    return int((b - a).total_seconds() // 60)
+    return (time.time_ns() // 1_000_000).to_bytes(6, "big").hex() + os.urandom(10).hex()
 
 
 def normalize_priority(p: str) -> str:
     p = (p or "").strip().upper()
-    if p not in PRIORITIES:
-        raise HTTPException(status_code=400, detail=f"Invalid priority '{p}'. Must be one of {PRIORITIES}")
+    if p not in _PRIORITIES_SET:
+        raise HTTPException(status_code=400, detail=f"Invalid priority '{p}'. Must be one of {_PRIORITIES_MSG}")
     return p
 
 
 def normalize_status(s: str) -> str:
     s = (s or "").strip().lower()
-    if s not in STATUSES:
-        raise HTTPException(status_code=400, detail=f"Invalid status '{s}'. Must be one of {STATUSES}")
+    if s not in _STATUSES_SET:
+        raise HTTPException(status_code=400, detail=f"Invalid status '{s}'. Must be one of {_STATUSES_MSG}")
     return s
 
 
 def normalize_role(r: str) -> str:
     r = (r or "").strip()
-    if r not in ROLES:
-        raise HTTPException(status_code=400, detail=f"Invalid resolved_by '{r}'. Must be one of {ROLES}")
+    if r not in _ROLES_SET:
+        raise HTTPException(status_code=400, detail=f"Invalid resolved_by '{r}'. Must be one of {_ROLES_MSG}")
     return r
 
 
+_local = threading.local()
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+
 def db() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    """
+    Return this thread's long-lived connection (opened on first use).
+    Keeps SQLite's page cache warm instead of reconnecting per request.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
     return conn
 
 
 # =========================================
 # DB init + migrations
 # =========================================
-def _has_column(conn: sqlite3.Connection, table: str, col: str) -> bool:
-    rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-    return any(r["name"] == col for r in rows)
-
-
 def init_db() -> None:
     conn = db()
-    cur = conn.cursor()
+    with conn:
+        cur = conn.cursor()
+        # DDL doesn't open a transaction implicitly; start one so the
+        # schema changes commit (or roll back) together. IMMEDIATE takes the
+        # write lock up front so concurrent workers queue instead of deadlocking.
+        cur.execute("BEGIN IMMEDIATE")
+
+        cur.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, val TEXT)")
+        row = cur.execute("SELECT val FROM meta WHERE key = 'schema_version'").fetchone()
+        if row and row[0] == SCHEMA_VERSION:
+            return
+
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS incidents (
+                id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                description TEXT NOT NULL,
+                priority TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'open',
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT '',
+                resolved_at TEXT,
+                resolved_by TEXT,
+                resolution_notes TEXT
+            )
+            """
+        )
 
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS incidents (
-            id TEXT PRIMARY KEY,
-            title TEXT NOT NULL,
-            description TEXT NOT NULL,
-            priority TEXT NOT NULL,
-            status TEXT NOT NULL DEFAULT 'open',
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL DEFAULT '',
-            resolved_at TEXT,
-            resolved_by TEXT,
-            resolution_notes TEXT
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS timeline (
+                id TEXT PRIMARY KEY,
+                incident_id TEXT NOT NULL,
+                event_type TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                old_value TEXT,
+                new_value TEXT,
+                FOREIGN KEY(incident_id) REFERENCES incidents(id)
+            )
+            """
         )
-        """
-    )
 
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS timeline (
-            id TEXT PRIMARY KEY,
-            incident_id TEXT NOT NULL,
-            event_type TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            old_value TEXT,
-            new_value TEXT,
-            FOREIGN KEY(incident_id) REFERENCES incidents(id)
+        # --- Migrate existing DBs (add missing columns safely) ---
+        cols = {r[1] for r in cur.execute("PRAGMA table_info(incidents)").fetchall()}
+        if "status" not in cols:
+            cur.execute("ALTER TABLE incidents ADD COLUMN status TEXT NOT NULL DEFAULT 'open'")
+        if "updated_at" not in cols:
+            cur.execute("ALTER TABLE incidents ADD COLUMN updated_at TEXT NOT NULL DEFAULT ''")
+        if "resolution_notes" not in cols:
+            cur.execute("ALTER TABLE incidents ADD COLUMN resolution_notes TEXT")
+        if "resolved_at" not in cols:
+            cur.execute("ALTER TABLE incidents ADD COLUMN resolved_at TEXT")
+        if "resolved_by" not in cols:
+            cur.execute("ALTER TABLE incidents ADD COLUMN resolved_by TEXT")
+
+        # --- Indexes for the status/created_at and timeline lookups ---
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_incidents_status_created ON incidents(status, created_at DESC)")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_incidents_resolved_at ON incidents(status, resolved_at DESC) "
+            "WHERE status = 'resolved'"
+        )
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_timeline_inc_created ON timeline(incident_id, created_at DESC)")
+        cur.execute("ANALYZE")
+
+        cur.execute(
+            "INSERT OR REPLACE INTO meta (key, val) VALUES ('schema_version', ?)",
+            (SCHEMA_VERSION,),
+        )
+
+
+def add_timeline(
+    events: List[Tuple[Any, ...]],
+    incident_id: str,
+    event_type: str,
+    old: Any = None,
+    new: Any = None,
+    now_iso: Optional[str] = None,
+) -> None:
+    """Queue a timeline row; write the batch with insert_timeline() in the caller's transaction."""
+    events.append(
+        (
+            _new_id(),
+            incident_id,
+            event_type,
+            now_iso or dt_to_iso(utcnow()),
+            None if old is None else str(old),
+            None if new is None else str(new),
         )
-        """
     )
 
-    # --- Migrate existing DBs (add missing columns safely) ---
-    if not _has_column(conn, "incidents", "status"):
-        cur.execute("ALTER TABLE incidents ADD COLUMN status TEXT NOT NULL DEFAULT 'open'")
-    if not _has_column(conn, "incidents", "updated_at"):
-        cur.execute("ALTER TABLE incidents ADD COLUMN updated_at TEXT NOT NULL DEFAULT ''")
-    if not _has_column(conn, "incidents", "resolution_notes"):
-        cur.execute("ALTER TABLE incidents ADD COLUMN resolution_notes TEXT")
-    if not _has_column(conn, "incidents", "resolved_at"):
-        cur.execute("ALTER TABLE incidents ADD COLUMN resolved_at TEXT")
-    if not _has_column(conn, "incidents", "resolved_by"):
-        cur.execute("ALTER TABLE incidents ADD COLUMN resolved_by TEXT")
-
-    conn.commit()
-    conn.close()
-
-
-def add_timeline(conn: sqlite3.Connection, incident_id: str, event_type: str, old: Any = None, new: Any = None) -> None:
-    tid = str(uuid.uuid4())
-    now = dt_to_iso(utcnow())
-    conn.execute(
+
+def insert_timeline(conn: sqlite3.Connection, events: List[Tuple[Any, ...]]) -> None:
+    conn.executemany(
         """
         INSERT INTO timeline (id, incident_id, event_type, created_at, old_value, new_value)
         VALUES (?, ?, ?, ?, ?, ?)
         """,
-        (tid, incident_id, event_type, now, None if old is None else str(old), None if new is None else str(new)),
+        events,
     )
 
 
-def _row_get(row: sqlite3.Row, key: str, default=None):
-    try:
-        return row[key]
-    except Exception:
-        return default
+# Explicit column order: migrated DBs append ALTERed columns, so SELECT *
+# order differs between databases.
+INCIDENT_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "priority",
+    "status",
+    "created_at",
+    "updated_at",
+    "resolved_at",
+    "resolved_by",
+    "resolution_notes",
+)
+INCIDENT_COLUMNS = ", ".join(INCIDENT_FIELDS)
 
 
-def incident_row_to_dict(row: sqlite3.Row) -> Dict[str, Any]:
-    return {
-        "id": _row_get(row, "id"),
-        "title": _row_get(row, "title"),
-        "description": _row_get(row, "description"),
-        "priority": _row_get(row, "priority"),
-        "status": _row_get(row, "status"),
-        "created_at": _row_get(row, "created_at"),
-        "updated_at": _row_get(row, "updated_at"),
-        "resolved_at": _row_get(row, "resolved_at"),
-        "resolved_by": _row_get(row, "resolved_by"),
-        "resolution_notes": _row_get(row, "resolution_notes"),
-    }
+def incident_row_to_dict(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Map a row selected with INCIDENT_COLUMNS."""
+    return dict(zip(INCIDENT_FIELDS, row))
 
 
 def seed_realistic_incidents_if_empty() -> None:
@@ -194,13 +258,12 @@ def seed_realistic_incidents_if_empty() -> None:
 
     conn = db()
     cur = conn.cursor()
-    cur.execute("SELECT COUNT(*) AS c FROM incidents")
-    count = int(cur.fetchone()["c"])
-    if count > 0:
-        conn.close()
+    cur.execute("SELECT 1 FROM incidents LIMIT 1")
+    if cur.fetchone():
         return
 
     now = utcnow()
+    now_iso = dt_to_iso(now)
     examples = [
         ("Checkout failing for DE customers", "Spike in 500s on /checkout for DE. Suspect recent release.", "P0", "open", now - timedelta(hours=3)),
         ("eSIM activation delays", "Activation API returning 202 for >10 minutes. Users stuck on pending.", "P1", "open", now - timedelta(hours=6)),
@@ -212,38 +275,45 @@ def seed_realistic_incidents_if_empty() -> None:
         ("Invoice generation stuck", "Nightly invoice job stuck at step 3/7. Manual run possible.", "P2", "open", now - timedelta(days=7)),
     ]
 
+    incident_rows: List[Tuple[Any, ...]] = []
+    timeline_rows: List[Tuple[Any, ...]] = []
     for title, desc, prio, status, created_at in examples:
-        iid = str(uuid.uuid4())
+        iid = _new_id()
         created_iso = dt_to_iso(created_at)
-        conn.execute(
+        incident_rows.append((iid, title, desc, prio, status, created_iso, created_iso))
+        add_timeline(timeline_rows, iid, "created", None, f"{prio} {status}", now_iso)
+
+    # One transaction for the whole batch
+    with conn:
+        conn.executemany(
             """
             INSERT INTO incidents (id, title, description, priority, status, created_at, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
-            (iid, title, desc, prio, status, created_iso, created_iso),
+            incident_rows,
         )
-        add_timeline(conn, iid, "created", None, f"{prio} {status}")
-
-    conn.commit()
-    conn.close()
+        insert_timeline(conn, timeline_rows)
 
 
 def backfill_resolved_fields() -> None:
     """
     If you have legacy rows where status='resolved' but resolved_at is missing,
     set resolved_at from updated_at (or created_at as last resort).
+
+    Runs once per database; new resolutions always set resolved_at.
     """
     conn = db()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        UPDATE incidents
-        SET resolved_at = COALESCE(NULLIF(resolved_at,''), NULLIF(updated_at,''), created_at)
-        WHERE status='resolved' AND (resolved_at IS NULL OR resolved_at = '')
-        """
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'backfilled'").fetchone():
+            return
+        conn.execute(
+            """
+            UPDATE incidents
+            SET resolved_at = COALESCE(NULLIF(resolved_at,''), NULLIF(updated_at,''), created_at)
+            WHERE status='resolved' AND (resolved_at IS NULL OR resolved_at = '')
+            """
+        )
+        conn.execute("INSERT OR REPLACE INTO meta (key, val) VALUES ('backfilled', '1')")
     # =========================================
 # API Models
 # =========================================
@@ -268,14 +338,14 @@ class TriageRequest(BaseModel):
 
 class TriageResponse(BaseModel):
     suggested_priority: str
-    next_steps: List[str]
+    next_steps: Tuple[str, ...]
     rationale: str
 
 
 # =========================================
 # App
 # =========================================
-app = FastAPI(title="Ops Triage Hub API", version="0.1.0")
+app = FastAPI(title="Ops Triage Hub API", version="0.1.0", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -304,272 +374,324 @@ def healthcheck() -> Dict[str, str]:
 @app.post("/incidents")
 def create_incident(payload: IncidentCreate) -> Dict[str, Any]:
     prio = normalize_priority(payload.priority)
-    now = utcnow()
-    iid = str(uuid.uuid4())
+    now_iso = dt_to_iso(utcnow())
+    iid = _new_id()
+
+    events: List[Tuple[Any, ...]] = []
+    add_timeline(events, iid, "created", None, f"{prio} open", now_iso)
 
     conn = db()
-    conn.execute(
-        """
-        INSERT INTO incidents (id, title, description, priority, status, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (iid, payload.title.strip(), payload.description.strip(), prio, "open", dt_to_iso(now), dt_to_iso(now)),
-    )
-    add_timeline(conn, iid, "created", None, f"{prio} open")
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            """
+            INSERT INTO incidents (id, title, description, priority, status, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (iid, payload.title.strip(), payload.description.strip(), prio, "open", now_iso, now_iso),
+        )
+        insert_timeline(conn, events)
+    invalidate_health_cache()
 
     return {"id": iid}
 
 
+LIST_INCIDENTS_SQL = f"""
+    SELECT {INCIDENT_COLUMNS} FROM incidents
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+LIST_INCIDENTS_BY_STATUS_SQL = f"""
+    SELECT {INCIDENT_COLUMNS} FROM incidents
+    WHERE status = ?
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+# Literal status (not a bound param) so the partial index applies.
+# resolved_at is always set for resolved rows (see backfill_resolved_fields).
+LIST_RESOLVED_INCIDENTS_SQL = f"""
+    SELECT {INCIDENT_COLUMNS} FROM incidents
+    WHERE status = 'resolved' AND resolved_at IS NOT NULL AND resolved_at >= ?
+    ORDER BY resolved_at DESC
+    LIMIT ?
+"""
+
+
 @app.get("/incidents")
 def list_incidents(
     status: Optional[str] = Query(default=None),
     days: int = Query(default=7, ge=1, le=365),
     limit: int = Query(default=50, ge=1, le=200),
-) -> List[Dict[str, Any]]:
-    conn = db()
-    where = []
-    params: List[Any] = []
-
-    if status:
+) -> ORJSONResponse:
+    if not status:
+        sql, params = LIST_INCIDENTS_SQL, (limit,)
+    else:
         s = normalize_status(status)
-        where.append("status = ?")
-        params.append(s)
         if s == "resolved":
             cutoff = utcnow() - timedelta(days=days)
-            where.append("COALESCE(NULLIF(resolved_at,''), NULLIF(updated_at,''), created_at) >= ?")
-            params.append(dt_to_iso(cutoff))
-
-    q = "SELECT * FROM incidents"
-    if where:
-        q += " WHERE " + " AND ".join(where)
+            sql, params = LIST_RESOLVED_INCIDENTS_SQL, (dt_to_iso(cutoff), limit)
+        else:
+            sql, params = LIST_INCIDENTS_BY_STATUS_SQL, (s, limit)
 
-    if status and status.lower() == "resolved":
-        q += " ORDER BY COALESCE(NULLIF(resolved_at,''), NULLIF(updated_at,''), created_at) DESC"
-    else:
-        q += " ORDER BY created_at DESC"
+    conn = db()
+    return ORJSONResponse([incident_row_to_dict(r) for r in conn.execute(sql, params)])
 
-    q += " LIMIT ?"
-    params.append(limit)
 
-    rows = conn.execute(q, tuple(params)).fetchall()
-    conn.close()
-    return [incident_row_to_dict(r) for r in rows]
+ACTIVE_INCIDENTS_SQL = f"""
+    SELECT {INCIDENT_COLUMNS} FROM incidents
+    WHERE status != 'resolved'
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
 
 
 @app.get("/ops/active-incidents")
-def active_incidents(limit: int = Query(default=200, ge=1, le=500)) -> List[Dict[str, Any]]:
+def active_incidents(limit: int = Query(default=200, ge=1, le=500)) -> ORJSONResponse:
     conn = db()
-    rows = conn.execute(
-        """
-        SELECT * FROM incidents
-        WHERE status != 'resolved'
-        ORDER BY created_at DESC
-        LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
-    conn.close()
-    return [incident_row_to_dict(r) for r in rows]
+    return ORJSONResponse([incident_row_to_dict(r) for r in conn.execute(ACTIVE_INCIDENTS_SQL, (limit,))])
+
+
+UPDATE_INCIDENT_SQL = f"""
+    UPDATE incidents
+    SET priority = ?, status = ?, updated_at = ?, resolved_at = ?, resolved_by = ?, resolution_notes = ?
+    WHERE id = ?
+    RETURNING {INCIDENT_COLUMNS}
+"""
+
+
 @app.patch("/incidents/{incident_id}")
 def patch_incident(incident_id: str, payload: IncidentPatch) -> Dict[str, Any]:
     new_status = normalize_status(payload.status)
+    # One timestamp for every field and timeline event written by this request
+    now_iso = dt_to_iso(utcnow())
 
     conn = db()
-    row = conn.execute("SELECT * FROM incidents WHERE id = ?", (incident_id,)).fetchone()
-    if not row:
-        conn.close()
-        raise HTTPException(status_code=404, detail="Incident not found")
-
-    old_status = row["status"]
-    allowed = STATUS_TRANSITIONS.get(old_status, [])
-    if new_status != old_status and new_status not in allowed:
-        conn.close()
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid status transition: {old_status} → {new_status}. Allowed: {allowed}",
-        )
-     # OPTIONAL: priority change (log to timeline)
-    if payload.priority:
-        new_prio = normalize_priority(payload.priority)
-        old_prio = row["priority"]
-        if new_prio != old_prio:
-            add_timeline(conn, incident_id, "priority_changed", old_prio, new_prio)
-            conn.execute(
-                "UPDATE incidents SET priority = ?, updated_at = ? WHERE id = ?",
-                (new_prio, dt_to_iso(utcnow()), incident_id),
+    with conn:
+        row = conn.execute(
+            "SELECT status, priority, resolved_at, resolved_by, resolution_notes FROM incidents WHERE id = ?",
+            (incident_id,),
+        ).fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="Incident not found")
+
+        # Start from current DB values (so partial patches work)
+        old_status, priority, old_resolved_at, old_resolved_by, resolution_notes = row
+        allowed = STATUS_TRANSITIONS.get(old_status, [])
+        if new_status != old_status and new_status not in allowed:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid status transition: {old_status} → {new_status}. Allowed: {allowed}",
             )
-            row = conn.execute("SELECT * FROM incidents WHERE id = ?", (incident_id,)).fetchone()   
-    # OPTIONAL: free-text note at any stage
-    if payload.note and payload.note.strip():
-        add_timeline(conn, incident_id, "note", None, payload.note.strip())
-    now = utcnow()
 
-    # Start from current DB values (so partial patches work)
-    resolved_at = row["resolved_at"]
-    resolved_by = row["resolved_by"]
-    resolution_notes = row["resolution_notes"]
-    priority = row["priority"]
-
-    # Optional: priority change at any stage
-    if payload.priority is not None:
-        new_prio = normalize_priority(payload.priority)
-        if new_prio != priority:
-            add_timeline(conn, incident_id, "resolution_notes", None, resolution_notes)
-            priority = new_prio
-
-    # Optional: add a free-text note at any stage (timeline only)
-    if payload.note is not None and payload.note.strip():
-        add_timeline(conn, incident_id, "note_added", None, payload.note.strip())
-
-    # Resolving requires metadata
-    if new_status == "resolved" and old_status != "resolved":
-        if not payload.resolved_by:
-            conn.close()
-            raise HTTPException(status_code=400, detail="resolved_by is required when resolving")
-        if not payload.resolution_notes or not payload.resolution_notes.strip():
-            conn.close()
-            raise HTTPException(status_code=400, detail="resolution_notes is required when resolving")
-
-        resolved_by = normalize_role(payload.resolved_by)
-        resolution_notes = payload.resolution_notes.strip()
-        resolved_at = dt_to_iso(now)
-
-        add_timeline(conn, incident_id, "resolved_by", row["resolved_by"], resolved_by)
-        add_timeline(conn, incident_id, "resolution_notes", None, "added")
-        add_timeline(conn, incident_id, "resolved_at", row["resolved_at"], resolved_at)
-
-    # Status change timeline
-    if new_status != old_status:
-        add_timeline(conn, incident_id, "status_changed", old_status, new_status)
-
-    conn.execute(
-        """
-        UPDATE incidents
-        SET priority = ?, status = ?, updated_at = ?, resolved_at = ?, resolved_by = ?, resolution_notes = ?
-        WHERE id = ?
-        """,
-        (priority, new_status, dt_to_iso(now), resolved_at, resolved_by, resolution_notes, incident_id),
-    )
-    conn.commit()
-
-    out = conn.execute("SELECT * FROM incidents WHERE id = ?", (incident_id,)).fetchone()
-    conn.close()
+        events: List[Tuple[Any, ...]] = []
+
+        resolved_at = old_resolved_at
+        resolved_by = old_resolved_by
+
+        # Optional: priority change at any stage
+        if payload.priority is not None:
+            new_prio = normalize_priority(payload.priority)
+            if new_prio != priority:
+                add_timeline(events, incident_id, "priority_changed", priority, new_prio, now_iso)
+                priority = new_prio
+
+        # Optional: add a free-text note at any stage (timeline only)
+        if payload.note is not None and payload.note.strip():
+            add_timeline(events, incident_id, "note", None, payload.note.strip(), now_iso)
+            add_timeline(events, incident_id, "note_added", None, payload.note.strip(), now_iso)
+
+        # Resolving requires metadata
+        if new_status == "resolved" and old_status != "resolved":
+            if not payload.resolved_by:
+                raise HTTPException(status_code=400, detail="resolved_by is required when resolving")
+            if not payload.resolution_notes or not payload.resolution_notes.strip():
+                raise HTTPException(status_code=400, detail="resolution_notes is required when resolving")
+
+            resolved_by = normalize_role(payload.resolved_by)
+            resolution_notes = payload.resolution_notes.strip()
+            resolved_at = now_iso
+
+            add_timeline(events, incident_id, "resolved_by", old_resolved_by, resolved_by, now_iso)
+            add_timeline(events, incident_id, "resolution_notes", None, "added", now_iso)
+            add_timeline(events, incident_id, "resolved_at", old_resolved_at, resolved_at, now_iso)
+
+        # Status change timeline
+        if new_status != old_status:
+            add_timeline(events, incident_id, "status_changed", old_status, new_status, now_iso)
+
+        out = conn.execute(
+            UPDATE_INCIDENT_SQL,
+            (priority, new_status, now_iso, resolved_at, resolved_by, resolution_notes, incident_id),
+        ).fetchone()
+        if events:
+            insert_timeline(conn, events)
+    invalidate_health_cache()
     return incident_row_to_dict(out)
 
 
 @app.get("/incidents/{incident_id}/timeline")
-def incident_timeline(incident_id: str) -> List[Dict[str, Any]]:
+def incident_timeline(incident_id: str) -> ORJSONResponse:
     conn = db()
     exists = conn.execute("SELECT 1 FROM incidents WHERE id = ?", (incident_id,)).fetchone()
     if not exists:
-        conn.close()
         raise HTTPException(status_code=404, detail="Incident not found")
 
     rows = conn.execute(
         """
-        SELECT * FROM timeline
+        SELECT id, incident_id, event_type, created_at, old_value, new_value FROM timeline
         WHERE incident_id = ?
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, rowid DESC
         """,
         (incident_id,),
-    ).fetchall()
-    conn.close()
+    )
 
-    return [
-        {
-            "id": r["id"],
-            "incident_id": r["incident_id"],
-            "event_type": r["event_type"],
-            "created_at": r["created_at"],
-            "old_value": r["old_value"],
-            "new_value": r["new_value"],
-        }
-        for r in rows
-    ]
+    return ORJSONResponse(
+        [
+            {
+                "id": tid,
+                "incident_id": iid,
+                "event_type": event_type,
+                "created_at": created_at,
+                "old_value": old_value,
+                "new_value": new_value,
+            }
+            for tid, iid, event_type, created_at, old_value, new_value in rows
+        ]
+    )
 # =========================================
 # Health + Recommendations
 # =========================================
-@dataclass
-class BreachView:
-    id: str
-    title: str
-    priority: str
-    status: str
-    created_at: str
-    age_minutes: int
-    sla_minutes: int
-    overdue_minutes: int
-
-
-def compute_breaches(now: datetime, incidents: List[Dict[str, Any]]) -> List[BreachView]:
-    out: List[BreachView] = []
-    for inc in incidents:
-        created = iso_to_dt(inc["created_at"]) or now
-        age = minutes_between(created, now)
-        sla = SLA_MINUTES.get(inc["priority"], 1440)
-        overdue = max(0, age - sla)
-        if overdue > 0 and inc["status"] != "resolved":
-            out.append(
-                BreachView(
-                    id=inc["id"],
-                    title=inc["title"],
-                    priority=inc["priority"],
-                    status=inc["status"],
-                    created_at=inc["created_at"],
-                    age_minutes=age,
-                    sla_minutes=sla,
-                    overdue_minutes=overdue,
-                )
-            )
-    out.sort(key=lambda x: x.overdue_minutes, reverse=True)
-    return out
-
-
-def aging_buckets(now: datetime, incidents: List[Dict[str, Any]]) -> Dict[str, int]:
-    b = {"lt_15m": 0, "m15_60": 0, "h1_4": 0, "h4_24": 0, "gte_24h": 0}
-    for inc in incidents:
-        if inc["status"] == "resolved":
-            continue
-        created = iso_to_dt(inc["created_at"]) or now
-        age = minutes_between(created, now)
-        if age < 15:
-            b["lt_15m"] += 1
-        elif age < 60:
-            b["m15_60"] += 1
-        elif age < 240:
-            b["h1_4"] += 1
-        elif age < 1440:
-            b["h4_24"] += 1
-        else:
-            b["gte_24h"] += 1
-    return b
+def _sql_minutes_between(a: str, b: str) -> str:
+    # Whole minutes from a to b. julianday() is only millisecond-accurate, so
+    # round to integer ms before dividing to avoid 59.999... → 59.
+    return f"(CAST(ROUND((julianday({b}) - julianday({a})) * 86400000) AS INTEGER) / 60000)"
+
+
+_SLA_CASE = (
+    "CASE priority "
+    + " ".join(f"WHEN '{p}' THEN {m}" for p, m in SLA_MINUTES.items())
+    + " ELSE 1440 END"
+)
+
+# Active incidents with their age and SLA (unparseable created_at counts as age 0).
+ACTIVE_AGES_SQL = f"""
+    SELECT id, title, priority, status, created_at,
+           COALESCE({_sql_minutes_between("created_at", ":now")}, 0) AS age_minutes,
+           {_SLA_CASE} AS sla_minutes
+    FROM incidents
+    WHERE status != 'resolved'
+"""
+
+MTTR_MINUTES_SQL = _sql_minutes_between("created_at", "resolved_at")
+
+# Statements are built once so each connection's prepared-statement cache
+# (keyed on the SQL text) is hit on every request.
+AGING_BUCKETS = ("lt_15m", "m15_60", "h1_4", "h4_24", "gte_24h")
+BREACH_FIELDS = ("id", "title", "priority", "status", "created_at", "age_minutes", "sla_minutes", "overdue_minutes")
+
+# Column order must match AGING_BUCKETS / BREACH_FIELDS (rows are unpacked positionally).
+HEALTH_AGGREGATE_SQL = f"""
+    SELECT COUNT(*) AS active_total,
+           SUM(age_minutes < 15) AS lt_15m,
+           SUM(age_minutes >= 15 AND age_minutes < 60) AS m15_60,
+           SUM(age_minutes >= 60 AND age_minutes < 240) AS h1_4,
+           SUM(age_minutes >= 240 AND age_minutes < 1440) AS h4_24,
+           SUM(age_minutes >= 1440) AS gte_24h,
+           SUM(age_minutes > sla_minutes) AS breached_total,
+           SUM(age_minutes > sla_minutes AND priority = 'P0') AS p0_breached
+    FROM ({ACTIVE_AGES_SQL})
+"""
+
+HEALTH_BREACHES_SQL = f"""
+    SELECT id, title, priority, status, created_at, age_minutes, sla_minutes,
+           age_minutes - sla_minutes AS overdue_minutes
+    FROM ({ACTIVE_AGES_SQL})
+    WHERE age_minutes > sla_minutes
+      AND (:priority IS NULL OR priority = :priority)
+    ORDER BY overdue_minutes DESC
+    LIMIT :limit
+"""
+
+HEALTH_MTTR_SQL = f"""
+    SELECT COUNT(m) AS resolved_count, AVG(m) AS avg_minutes
+    FROM (
+        SELECT {MTTR_MINUTES_SQL} AS m
+        FROM incidents
+        WHERE status = 'resolved'
+          AND resolved_at IS NOT NULL
+          AND resolved_at >= ?
+          AND julianday(resolved_at) >= julianday(created_at)
+    )
+"""
+
+
+_HEALTH_CACHE: Optional[Tuple[float, Dict[str, Any]]] = None
+_HEALTH_LOCK = threading.Lock()
+# Bumped on every write; a refresh that overlapped a write must not be cached.
+_HEALTH_GENERATION = 0
+
+
+def invalidate_health_cache() -> None:
+    global _HEALTH_CACHE, _HEALTH_GENERATION
+    _HEALTH_GENERATION += 1
+    _HEALTH_CACHE = None
+
+
+def get_health() -> Dict[str, Any]:
+    """Health payload, cached for HEALTH_CACHE_TTL_SECONDS."""
+    global _HEALTH_CACHE
+    cached = _HEALTH_CACHE
+    if cached and time.monotonic() - cached[0] < HEALTH_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    # One refresh at a time; late arrivals reuse the fresh result.
+    with _HEALTH_LOCK:
+        cached = _HEALTH_CACHE
+        if cached and time.monotonic() - cached[0] < HEALTH_CACHE_TTL_SECONDS:
+            return cached[1]
+        generation = _HEALTH_GENERATION
+        health = _compute_health()
+        if generation == _HEALTH_GENERATION:
+            _HEALTH_CACHE = (time.monotonic(), health)
+        return health
 
 
 @app.get("/ops/health")
-def ops_health() -> Dict[str, Any]:
+def ops_health() -> ORJSONResponse:
+    # Payload is plain JSON types already: skip response validation + jsonable_encoder.
+    return ORJSONResponse(get_health())
+
+
+def _compute_health() -> Dict[str, Any]:
     now = utcnow()
+    now_iso = dt_to_iso(now)
 
     conn = db()
-    rows = conn.execute("SELECT * FROM incidents WHERE status != 'resolved'").fetchall()
-    conn.close()
-
-    incidents = [incident_row_to_dict(r) for r in rows]
-    breaches = compute_breaches(now, incidents)
-    breached_total = len(breaches)
-    active_total = len(incidents)
-    buckets = aging_buckets(now, incidents)
+    active_total, *bucket_counts, breached_total, p0_breached = conn.execute(
+        HEALTH_AGGREGATE_SQL, {"now": now_iso}
+    ).fetchone()
+    breached_total = breached_total or 0
+    p0_breached = p0_breached or 0
+    buckets = {k: n or 0 for k, n in zip(AGING_BUCKETS, bucket_counts)}
+
+    breaches = [
+        dict(zip(BREACH_FIELDS, r))
+        for r in conn.execute(HEALTH_BREACHES_SQL, {"now": now_iso, "priority": None, "limit": 100})
+    ]
 
     reasons: List[Dict[str, Any]] = []
 
-    p0_breaches = [b for b in breaches if b.priority == "P0"]
-    if p0_breaches:
+    if p0_breached:
+        p0_breaches = [
+            dict(zip(BREACH_FIELDS, r))
+            for r in conn.execute(HEALTH_BREACHES_SQL, {"now": now_iso, "priority": "P0", "limit": 3})
+        ]
         reasons.append(
             {
                 "code": "sla_breach_p0",
-                "label": f"{len(p0_breaches)} P0 SLA breach(es)",
-                "top_incidents": [b.__dict__ for b in p0_breaches[:3]],
+                "label": f"{p0_breached} P0 SLA breach(es)",
+                "top_incidents": p0_breaches,
             }
         )
 
@@ -578,7 +700,7 @@ def ops_health() -> Dict[str, Any]:
             {
                 "code": "sla_breaches_total",
                 "label": f"{breached_total} total SLA breaches (>= {BREACH_THRESHOLD_TOTAL})",
-                "top_incidents": [b.__dict__ for b in breaches[:3]],
+                "top_incidents": breaches[:3],
             }
         )
 
@@ -587,7 +709,7 @@ def ops_health() -> Dict[str, Any]:
             {
                 "code": "aging_24h",
                 "label": f"{buckets['gte_24h']} incidents aged 24h+ (>= {AGING_THRESHOLD_24H})",
-                "top_incidents": [b.__dict__ for b in breaches[:3]] if breaches else [],
+                "top_incidents": breaches[:3],
             }
         )
 
@@ -598,37 +720,19 @@ def ops_health() -> Dict[str, Any]:
         status = "amber"
 
     # MTTR (resolved in last 7 days)
-    conn = db()
-    cutoff = utcnow() - timedelta(days=7)
-    mttr_rows = conn.execute(
-        """
-        SELECT created_at, resolved_at
-        FROM incidents
-        WHERE status = 'resolved'
-          AND resolved_at IS NOT NULL
-          AND resolved_at >= ?
-        """,
-        (dt_to_iso(cutoff),),
-    ).fetchall()
-    conn.close()
-
-    mttrs: List[int] = []
-    for r in mttr_rows:
-        cdt = iso_to_dt(r["created_at"])
-        rdt = iso_to_dt(r["resolved_at"])
-        if cdt and rdt and rdt >= cdt:
-            mttrs.append(minutes_between(cdt, rdt))
+    cutoff = now - timedelta(days=7)
+    mttr_count, mttr_avg = conn.execute(HEALTH_MTTR_SQL, (dt_to_iso(cutoff),)).fetchone()
 
-    mttr_avg = int(sum(mttrs) / len(mttrs)) if mttrs else None
+    mttr_avg = int(mttr_avg) if mttr_avg is not None else None
 
     return {
-        "generated_at": dt_to_iso(now),
+        "generated_at": now_iso,
         "active_total": active_total,
         "aging_buckets": buckets,
         "sla": SLA_MINUTES,
         "breached_total": breached_total,
-        "breached": [b.__dict__ for b in breaches[:100]],
-        "mttr": {"window_days": 7, "resolved_count": len(mttrs), "avg_minutes": mttr_avg},
+        "breached": breaches,
+        "mttr": {"window_days": 7, "resolved_count": mttr_count, "avg_minutes": mttr_avg},
         "score": {"status": status, "reasons": reasons},
     }
 
@@ -733,7 +837,7 @@ def make_recommendations(health: Dict[str, Any], top_n: int) -> List[Dict[str, A
 
 @app.get("/ops/recommendations")
 def ops_recommendations(top_n: int = Query(default=3, ge=1, le=10)) -> Dict[str, Any]:
-    h = ops_health()
+    h = get_health()
     recs = make_recommendations(h, top_n=top_n)
     return {
         "generated_at": dt_to_iso(utcnow()),
@@ -744,7 +848,7 @@ def ops_recommendations(top_n: int = Query(default=3, ge=1, le=10)) -> Dict[str,
 
 @app.get("/ops/recommendations/summary")
 def ops_recommendations_summary() -> Dict[str, Any]:
-    h = ops_health()
+    h = get_health()
     status = h["score"]["status"]
     reasons = h["score"]["reasons"]
 
@@ -762,6 +866,28 @@ def ops_recommendations_summary() -> Dict[str, Any]:
 # =========================================
 # KPIs
 # =========================================
+KPIS_SUMMARY_SQL = f"""
+    SELECT COUNT(*) AS resolved_count,
+           SUM(priority = 'P0') AS p0_resolved_count,
+           AVG(CASE WHEN julianday(resolved_at) >= julianday(created_at) THEN {MTTR_MINUTES_SQL} END) AS avg_mttr
+    FROM incidents
+    WHERE status = 'resolved'
+      AND resolved_at IS NOT NULL
+      AND resolved_at >= ?
+"""
+
+KPIS_TOP_RESOLVERS_SQL = """
+    SELECT COALESCE(NULLIF(TRIM(resolved_by), ''), 'Unassigned') AS role, COUNT(*) AS resolved
+    FROM incidents
+    WHERE status = 'resolved'
+      AND resolved_at IS NOT NULL
+      AND resolved_at >= ?
+    GROUP BY role
+    ORDER BY resolved DESC, role
+    LIMIT 5
+"""
+
+
 @app.get("/ops/kpis")
 def ops_kpis(days: int = Query(default=7, ge=1, le=90)) -> Dict[str, Any]:
     """
@@ -773,47 +899,22 @@ def ops_kpis(days: int = Query(default=7, ge=1, le=90)) -> Dict[str, Any]:
       - incidents.resolved_at
       - incidents.resolved_by
     """
-    cutoff = utcnow() - timedelta(days=days)
+    now = utcnow()
+    cutoff = now - timedelta(days=days)
 
     conn = db()
-    rows = conn.execute(
-        """
-        SELECT id, priority, created_at, resolved_at, resolved_by
-        FROM incidents
-        WHERE status = 'resolved'
-          AND COALESCE(NULLIF(resolved_at,''), NULLIF(updated_at,''), created_at) >= ?
-        """,
-        (dt_to_iso(cutoff),),
-    ).fetchall()
-    conn.close()
-
-    resolved_count = len(rows)
-    p0_resolved_count = 0
-    mttrs: List[int] = []
-    by_role: Dict[str, int] = {}
-
-    for r in rows:
-        if r["priority"] == "P0":
-            p0_resolved_count += 1
-
-        cdt = iso_to_dt(r["created_at"])
-        rdt = iso_to_dt(r["resolved_at"]) if r["resolved_at"] else None
-        if cdt and rdt and rdt >= cdt:
-            mttrs.append(minutes_between(cdt, rdt))
-
-        role = (r["resolved_by"] or "").strip() or "Unassigned"
-        by_role[role] = by_role.get(role, 0) + 1
-
-    avg_mttr = int(sum(mttrs) / len(mttrs)) if mttrs else None
+    cutoff_iso = dt_to_iso(cutoff)
+    resolved_count, p0_resolved_count, avg_mttr = conn.execute(KPIS_SUMMARY_SQL, (cutoff_iso,)).fetchone()
+    top_resolvers = [
+        {"role": role, "resolved": resolved}
+        for role, resolved in conn.execute(KPIS_TOP_RESOLVERS_SQL, (cutoff_iso,))
+    ]
 
-    top_resolvers = sorted(
-        [{"role": k, "resolved": v} for k, v in by_role.items()],
-        key=lambda x: x["resolved"],
-        reverse=True,
-    )[:5]
+    p0_resolved_count = p0_resolved_count or 0
+    avg_mttr = int(avg_mttr) if avg_mttr is not None else None
 
     return {
-        "generated_at": dt_to_iso(utcnow()),
+        "generated_at": dt_to_iso(now),
         "window_days": days,
         "resolved_count": resolved_count,
         "p0_resolved_count": p0_resolved_count,
@@ -825,68 +926,159 @@ def ops_kpis(days: int = Query(default=7, ge=1, le=90)) -> Dict[str, Any]:
 # =========================================
 # AI Triage (demo rules)
 # =========================================
-def triage_rules(title: str, desc: str) -> Tuple[str, List[str], str]:
-    text = f"{title}\n{desc}".lower()
-
-    p0_hits = ["checkout", "payment", "outage", "500", "down", "failed", "critical", "sev0", "p0"]
-    p1_hits = ["activation", "delay", "degraded", "latency", "timeout", "sev1", "p1"]
-    p2_hits = ["slow", "backlog", "retry", "webhook", "billing", "p2"]
-
-    def count(hits: List[str]) -> int:
-        return sum(1 for h in hits if h in text)
-
-    s0, s1, s2 = count(p0_hits), count(p1_hits), count(p2_hits)
-
-    if s0 >= 2 or ("outage" in text) or ("payment" in text and "failed" in text):
-        return (
-            "P0",
-            [
-                "Assign an owner (On-call)",
-                "Confirm blast radius + impacted customers",
-                "Mitigate (rollback/feature flag/traffic shift)",
-                "Post status update + next update time",
-                "Resolve with notes + follow-ups",
-            ],
-            "Signals indicate critical customer impact / outage risk.",
-        )
-
-    if s1 >= 2 or ("activation" in text and "delay" in text):
-        return (
-            "P1",
-            [
-                "Confirm symptoms + metrics (latency/errors)",
-                "Engage owning team; check recent changes",
-                "Apply mitigation and monitor recovery",
-                "Communicate externally if needed",
-                "Create follow-up if recurring",
-            ],
-            "Signals indicate degraded service impacting user experience and SLAs.",
-        )
+# Keyword matching is memory-bound, not compute-bound: the cost is walking
+# the input text, and the whole keyword table (22 short strings + bitmasks)
+# is a few hundred bytes that stay cache-resident. Speedups come from
+# touching fewer bytes (early tier exit, cached repeats, no joined copy),
+# not from compute tricks. CPython's C-level `in` beat regex alternation,
+# bytes.translate case-folding and token splitting when measured here.
+#
+# Keyword tables are built once at import, not per request.
+P0_HITS = ("checkout", "payment", "outage", "500", "down", "failed", "critical", "sev0", "p0")
+P1_HITS = ("activation", "delay", "degraded", "latency", "timeout", "sev1", "p1")
+P2_HITS = ("slow", "backlog", "retry", "webhook", "billing", "p2")
+
+# One flat (keyword, bucket, bit) table so a single loop fills all three
+# counts; each keyword owns a stable bit in the hits mask.
+TRIAGE_KEYWORDS = tuple(
+    (kw, bucket, 1 << idx)
+    for idx, (kw, bucket) in enumerate(
+        [(kw, 0) for kw in P0_HITS] + [(kw, 1) for kw in P1_HITS] + [(kw, 2) for kw in P2_HITS]
+    )
+)
+_KEYWORD_BIT = {kw: bit for kw, _, bit in TRIAGE_KEYWORDS}
+
+# Compound rules as bitmasks over the hits mask.
+P0_OUTAGE_MASK = _KEYWORD_BIT["outage"]
+P0_PAYMENT_FAILED_MASK = _KEYWORD_BIT["payment"] | _KEYWORD_BIT["failed"]
+P1_ACTIVATION_DELAY_MASK = _KEYWORD_BIT["activation"] | _KEYWORD_BIT["delay"]
+
+
+# Per-tier results are immutable constants; triage_rules returns references.
+_P0_RESULT = (
+    "P0",
+    (
+        "Assign an owner (On-call)",
+        "Confirm blast radius + impacted customers",
+        "Mitigate (rollback/feature flag/traffic shift)",
+        "Post status update + next update time",
+        "Resolve with notes + follow-ups",
+    ),
+    "Signals indicate critical customer impact / outage risk.",
+)
+_P1_RESULT = (
+    "P1",
+    (
+        "Confirm symptoms + metrics (latency/errors)",
+        "Engage owning team; check recent changes",
+        "Apply mitigation and monitor recovery",
+        "Communicate externally if needed",
+        "Create follow-up if recurring",
+    ),
+    "Signals indicate degraded service impacting user experience and SLAs.",
+)
+_P2_RESULT = (
+    "P2",
+    (
+        "Validate incident is actionable (not duplicate/noise)",
+        "Assign ownership + next action",
+        "Check breach risk and adjust priority if needed",
+        "Convert repeats into Problem ticket",
+    ),
+    "Signals suggest operational risk/backlog pressure rather than immediate outage.",
+)
+_P3_RESULT = (
+    "P3",
+    (
+        "Capture context + repro steps",
+        "Assign to backlog with acceptance criteria",
+        "Review in weekly ops cadence",
+    ),
+    "Signals suggest low urgency; track for hygiene and prevent future issues.",
+)
 
-    if s2 >= 1:
-        return (
-            "P2",
-            [
-                "Validate incident is actionable (not duplicate/noise)",
-                "Assign ownership + next action",
-                "Check breach risk and adjust priority if needed",
-                "Convert repeats into Problem ticket",
-            ],
-            "Signals suggest operational risk/backlog pressure rather than immediate outage.",
-        )
 
-    return (
-        "P3",
-        [
-            "Capture context + repro steps",
-            "Assign to backlog with acceptance criteria",
-            "Review in weekly ops cadence",
-        ],
-        "Signals suggest low urgency; track for hygiene and prevent future issues.",
+# Prebuilt, already-valid response per priority; skips model validation
+# on every /triage call.
+_TRIAGE_RESPONSES = {
+    prio: TriageResponse.model_construct(
+        suggested_priority=prio, next_steps=steps, rationale=rationale
     )
+    for prio, steps, rationale in (_P0_RESULT, _P1_RESULT, _P2_RESULT, _P3_RESULT)
+}
+
+
+# Hit/miss counts are available via triage_rules.cache_info().
+@lru_cache(maxsize=TRIAGE_CACHE_SIZE)
+def triage_rules(title: str, desc: str) -> Tuple[str, Tuple[str, ...], str]:
+    # Keywords never contain a newline, so scanning title and description
+    # separately matches exactly what the old "title\ndesc" join did, without
+    # building a third string the size of both.
+    t = title.lower()
+    d = desc.lower()
+
+    # TRIAGE_KEYWORDS is ordered P0, P1, P2, and each tier's rule only
+    # depends on its own hits, so return as soon as a tier is decided.
+    counts = [0, 0, 0]
+    hits_mask = 0
+    for kw, bucket, bit in TRIAGE_KEYWORDS:
+        if kw in t or kw in d:
+            counts[bucket] += 1
+            hits_mask |= bit
+            if bucket == 0:
+                if (
+                    counts[0] >= 2
+                    or hits_mask & P0_OUTAGE_MASK
+                    or (hits_mask & P0_PAYMENT_FAILED_MASK) == P0_PAYMENT_FAILED_MASK
+                ):
+                    return _P0_RESULT
+            elif bucket == 1:
+                if counts[1] >= 2 or (hits_mask & P1_ACTIVATION_DELAY_MASK) == P1_ACTIVATION_DELAY_MASK:
+                    return _P1_RESULT
+            else:
+                return _P2_RESULT
+
+    return _P3_RESULT
 
 
 @app.post("/triage", response_model=TriageResponse)
 def triage(payload: TriageRequest) -> TriageResponse:
-    prio, steps, rationale = triage_rules(payload.title, payload.description)
-    return TriageResponse(suggested_priority=prio, next_steps=steps, rationale=rationale)
\ No newline at end of file
+    return _TRIAGE_RESPONSES[triage_rules(payload.title, payload.description)[0]]
+
+
+@app.post("/triage:batch", response_model=List[TriageResponse])
+def triage_batch(
+    items: List[TriageRequest] = Body(..., max_length=TRIAGE_BATCH_MAX_ITEMS),
+) -> List[TriageResponse]:
+    # One request for backfills instead of N round-trips; per-item scanning
+    # stays in triage_rules so repeats hit its cache.
+    return [_TRIAGE_RESPONSES[triage_rules(it.title, it.description)[0]] for it in items]
+
+
+# Same limits as TriageRequest; oversized input must never reach the cached
+# triage_rules. The raw-body cap rejects huge payloads before parsing
+# (5120 chars at worst 6 bytes each as JSON \u escapes, plus keys).
+TRIAGE_FAST_MAX_BODY_BYTES = 32 * 1024
+
+
+@app.post("/triage/fast")
+async def triage_fast(request: Request) -> ORJSONResponse:
+    # Internal dashboard path: skips pydantic request/response validation.
+    # External callers keep using the validated /triage.
+    raw = await request.body()
+    if len(raw) > TRIAGE_FAST_MAX_BODY_BYTES:
+        raise HTTPException(status_code=400, detail="Body too large")
+    try:
+        body = orjson.loads(raw)
+        title, desc = body["title"], body["description"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Body must be JSON with 'title' and 'description'") from None
+    if not isinstance(title, str) or not isinstance(desc, str):
+        raise HTTPException(status_code=400, detail="'title' and 'description' must be strings")
+    if not 3 <= len(title) <= 120:
+        raise HTTPException(status_code=400, detail="'title' must be 3-120 characters")
+    if not 10 <= len(desc) <= 5000:
+        raise HTTPException(status_code=400, detail="'description' must be 10-5000 characters")
+
+    prio, steps, rationale = triage_rules(title, desc)
+    return ORJSONResponse({"suggested_priority": prio, "next_steps": steps, "rationale": rationale})
\ No newline at end of file